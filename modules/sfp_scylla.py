@@ -57,12 +57,21 @@ class sfp_scylla(SpiderFootPlugin):
 
     results = None
     errorState = False
+    headers = None
 
     def setup(self, sfc, userOpts=dict()):
         self.sf = sfc
         self.results = self.tempStorage()
         self.errorState = False
 
+        b64_auth = base64.b64encode("sammy:BasicPassword!".encode("utf-8"))
+        self.headers = {
+            'Accept': 'application/json',
+            # Provided by @_hyp3ri0n on Twitter, owner of the service and granted
+            # permission to hard-code these.
+            'Authorization': "Basic " + b64_auth.decode("utf-8")
+        }
+
         for opt in list(userOpts.keys()):
             self.opts[opt] = userOpts[opt]
 
@@ -82,15 +91,8 @@ class sfp_scylla(SpiderFootPlugin):
             'from': str(start)
         }
 
-        b64_auth = base64.b64encode("sammy:BasicPassword!".encode("utf-8"))
-        headers = {
-            'Accept': 'application/json',
-            # Provided by @_hyp3ri0n on Twitter, owner of the service and granted
-            # permission to hard-code these.
-            'Authorization': "Basic " + b64_auth.decode("utf-8")
-        }
         res = self.sf.fetchUrl('https://scylla.sh/search?' + urllib.parse.urlencode(params),
-                               headers=headers,
+                               headers=self.headers,
                                timeout=15,
                                useragent=self.opts['_useragent'],
                                # expired certficate
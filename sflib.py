@@ -61,6 +61,8 @@ class SpiderFoot:
     _dbh = None
     _scanId = None
     _socksProxy = None
+    _httpAdapter = None
+    _httpAdapterNoVerify = None
     opts = dict()
     log = logging.getLogger(__name__)
 
@@ -84,6 +86,17 @@ class SpiderFoot:
             res.nameservers = [self.opts['_dnsserver']]
             dns.resolver.override_system_resolver(res)
 
+        # Shared by all sessions returned by getSession() so that
+        # connections to the same host are pooled and re-used.
+        # Verified and unverified (verify=False) requests use separate
+        # pools, so that a connection opened without certificate
+        # verification is never handed to a request expecting it.
+        # pool_maxsize matches the most threads any module runs at once
+        # (sfp_accounts, 50); beyond that, surplus connections to a host
+        # are discarded after use rather than blocking.
+        self._httpAdapter = requests.adapters.HTTPAdapter(pool_maxsize=50)
+        self._httpAdapterNoVerify = requests.adapters.HTTPAdapter(pool_maxsize=50)
+
     @property
     def dbh(self):
         """Database handle
@@ -2417,8 +2430,22 @@ class SpiderFoot:
     def urlEncodeUnicode(self, url):
         return re.sub('[\x80-\xFF]', lambda c: '%%%02x' % ord(c.group(0)), url)
 
-    def getSession(self):
+    def getSession(self, verify=True):
+        """Return a new requests session backed by the shared connection pool.
+
+        Args:
+            verify (bool): whether requests made with the session verify SSL certificates
+
+        Returns:
+            requests.sessions.Session: session
+        """
         session = requests.session()
+        if verify:
+            adapter = self._httpAdapter
+        else:
+            adapter = self._httpAdapterNoVerify
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         if self.socksProxy:
             session.proxies = {
                 'http': self.socksProxy,
@@ -2539,7 +2566,7 @@ class SpiderFoot:
                 if not noLog:
                     self.info(f"Fetching (HEAD only): {self.removeUrlCreds(url)} [user-agent: {header['User-Agent']}] [timeout: {timeout}]")
 
-                hdr = self.getSession().head(
+                hdr = self.getSession(verify).head(
                     url,
                     headers=header,
                     proxies=proxies,
@@ -2565,7 +2592,7 @@ class SpiderFoot:
                     if not noLog:
                         self.info(f"Fetching (HEAD only): {self.removeUrlCreds(url)} [user-agent: {header['User-Agent']}] [timeout: {timeout}]")
 
-                    hdr = self.getSession().head(
+                    hdr = self.getSession(verify).head(
                         result['realurl'],
                         headers=header,
                         proxies=proxies,
@@ -2587,7 +2614,7 @@ class SpiderFoot:
 
             try:
                 if postData:
-                    res = self.getSession().post(
+                    res = self.getSession(verify).post(
                         url,
                         data=postData,
                         headers=header,
@@ -2598,7 +2625,7 @@ class SpiderFoot:
                         verify=verify
                     )
                 else:
-                    res = self.getSession().get(
+                    res = self.getSession(verify).get(
                         url,
                         headers=header,
                         proxies=proxies,
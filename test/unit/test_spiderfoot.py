@@ -1403,6 +1403,26 @@ class TestSpiderFoot(unittest.TestCase):
         session = sf.getSession()
         self.assertIn("requests.sessions.Session", str(session))
 
+    def test_get_session_should_share_connection_pool_between_sessions(self):
+        """
+        Test getSession(self)
+        """
+        sf = SpiderFoot(self.default_options)
+        session1 = sf.getSession()
+        session2 = sf.getSession()
+        self.assertIs(session1.get_adapter('http://x'), session2.get_adapter('http://x'))
+        self.assertIs(session1.get_adapter('https://x'), session2.get_adapter('https://x'))
+
+    def test_get_session_should_not_share_connection_pool_between_verified_and_unverified_sessions(self):
+        """
+        Test getSession(self, verify=True)
+        """
+        sf = SpiderFoot(self.default_options)
+        session1 = sf.getSession(verify=True)
+        session2 = sf.getSession(verify=False)
+        self.assertIsNot(session1.get_adapter('https://x'), session2.get_adapter('https://x'))
+        self.assertIs(session2.get_adapter('https://x'), sf.getSession(verify=False).get_adapter('https://x'))
+
     def test_remove_url_creds_should_remove_credentials_from_url(self):
         """
         Test removeUrlCreds(self, url):